@@ -3,13 +3,74 @@ import os
 import pathlib
 import importlib.resources
 import collections
+import concurrent.futures
+import copy
+import functools
+import re
+import sys
+import threading
+
+# use the C implementations of libyaml, when available
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+try:
+    from yaml import CDumper as _Dumper
+except ImportError:
+    from yaml import Dumper as _Dumper
 
 from .registry import get_registered_variable
 
-_modifiable = "_modifiable"
-_sub_config_key = "_sub_config_key"
-_registry_key = "_registry_key"
-_ignore_keys = [_modifiable, _sub_config_key, _registry_key]
+# names of internal entries, interned so that comparisons with attribute names are identity checks
+_modifiable = sys.intern("_modifiable")
+_sub_config_key = sys.intern("_sub_config_key")
+_registry_key = sys.intern("_registry_key")
+_ns_children = sys.intern("_ns_children")
+_ignore_keys = frozenset((_modifiable, _sub_config_key, _registry_key, _ns_children))
+# matches any `{KEY}` inside a string that should be formatted
+_format_pattern = re.compile(r"\{([^{}]+)\}")
+
+@functools.lru_cache(maxsize=256)
+def _parse_yaml_cached(path, mtime_ns, size):
+    """Parses the given YAML file and caches the result.
+    The modification time and the size of the file are part of the cache key, so that changed files are parsed again.
+    The returned dictionary is shared between calls and must not be modified, see :func:`_parse_yaml_file`."""
+    # pass the binary stream so that the loader can read and decode it by itself
+    with open(path, 'rb') as f:
+        # return the loaded yaml file, or an empty dictionary in case the loader returns None
+        return yaml.load(f, Loader=_SafeLoader) or {}
+
+
+def _cache_key(path):
+    """Returns the arguments of :func:`_parse_yaml_cached` for the given file"""
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    return path, stat.st_mtime_ns, stat.st_size
+
+
+def _parse_yaml_file(path):
+    """Returns a copy of the parsed contents of the given YAML file, which might be read from the cache"""
+    return copy.deepcopy(_parse_yaml_cached(*_cache_key(path)))
+
+
+def _format_value(value, lookup, prefixes):
+    """Replaces all `{KEY}` in the given string (or nested list of strings) with the value returned by `lookup(KEY)`.
+    The KEY is extended with all given prefixes, starting with the first; unknown keys are left untouched."""
+    if isinstance(value, list):
+        return [_format_value(v, lookup, prefixes) for v in value]
+    if not isinstance(value, str):
+        return value
+
+    def replace(match):
+        for prefix in prefixes:
+            formatted = lookup(prefix + match.group(1))
+            if formatted is not None:
+                return formatted
+        return match.group(0)
+
+    return _format_pattern.sub(replace, value)
+
 
 def list_config_files(package, configuration_file_extensions=[".yaml", ".yml"]):
     """Lists all configuration files found in the given package that have the given filename extensions.
@@ -26,15 +87,107 @@ def list_config_files(package, configuration_file_extensions=[".yaml", ".yml"]):
     A list of (configuration) files with relative paths from within the package.
 
     """
-    # read resource files within package
-    resource_files = importlib.resources.files(package).rglob("*")
+    return list(_iterate_config_files(package, configuration_file_extensions))
+
+
+def _iterate_config_files(package, configuration_file_extensions):
+    """Iterates over all files in the given package that have the given filename extensions"""
+    extensions = tuple(configuration_file_extensions)
+    root = importlib.resources.files(package)
+
+    if not isinstance(root, pathlib.Path):
+        # the package is not located on the file system (e.g., zipped), so we need to use the resource API
+        for resource_file in root.rglob("*"):
+            if resource_file.name.endswith(extensions):
+                yield resource_file
+        return
+
+    # walk through the package directory, and only create path objects for the files that we want to return
+    directories = [str(root)]
+    while directories:
+        with os.scandir(directories.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    directories.append(entry.path)
+                elif entry.name.endswith(extensions):
+                    yield pathlib.Path(entry.path)
+
+
+def _find_config_candidates(package, resource):
+    """Returns the files of the given package whose path ends with the given resource.
+    The search stops after two candidates have been found, which is enough to detect ambiguous resources."""
+    resource = str(resource)
+    candidates = []
+    for config_file in _iterate_config_files(package, [os.path.splitext(resource)[1]]):
+        if str(config_file).endswith(resource):
+            candidates.append(config_file)
+            if len(candidates) > 1:
+                break
+    return candidates
 
-    # filter files with the given extensions
-    return [
-        resource_file
-        for resource_file in resource_files
-        if os.path.splitext(resource_file)[1] in configuration_file_extensions
-    ]
+
+def _find_config_file(config):
+    """Finds the given configuration file, which might include package @ filename, and returns its path"""
+    if isinstance(config, pathlib.Path):
+        # paths are used as they are, without interpreting any @
+        splits = [str(config)]
+    else:
+        assert isinstance(config, str), f"The given configuration {config} is not a file name"
+        splits = config.split("@")
+
+    if len(splits) == 1:
+        # load config file directly
+        config = splits[0].strip()
+
+    elif len(splits) == 2:
+        # load config from package resources
+        package = splits[0].strip()
+        resource = pathlib.Path(splits[1].strip())
+        # find possible candidates for resource files
+        candidates = _find_config_candidates(package, resource)
+        if not len(candidates):
+            raise ValueError(f"Could not find configuration file {resource} in package {package}; possible files are: {list_config_files(package, [resource.suffix])}")
+        if len(candidates) > 1:
+            raise ValueError(f"The given config file {resource} is not unique in package {package}; candidates include: {candidates}")
+        # take the unique file
+        config = candidates[0]
+
+    else:
+        raise ValueError(f"Could not interpret configuration file {config}")
+
+    if not os.path.isfile(config):
+        raise IOError(f"Could not find config file {config}")
+
+    return config
+
+
+_prefetch_executor = None
+_prefetch_lock = threading.Lock()
+
+def _prefetch_config_file(config):
+    """Finds and parses the given configuration file, which might include package @ filename, into the cache.
+    Returns the path of the file, or None if it could not be loaded."""
+    try:
+        path = pathlib.Path(_find_config_file(config))
+        _parse_yaml_cached(*_cache_key(path))
+        return path
+    except (OSError, ValueError, yaml.YAMLError):
+        # errors are raised when the configuration file is actually loaded
+        return None
+
+
+def _prefetch_config_files(config_files):
+    """Finds and parses the given configuration files in parallel, and returns the paths of all files that could be loaded"""
+    global _prefetch_executor
+    # the threads are shared between all namespaces
+    if _prefetch_executor is None:
+        # namespaces might be loaded from several threads at once
+        with _prefetch_lock:
+            if _prefetch_executor is None:
+                _prefetch_executor = concurrent.futures.ThreadPoolExecutor(max_workers=8)
+    config_files = list(config_files)
+    paths = _prefetch_executor.map(_prefetch_config_file, config_files)
+    return {config:path for config, path in zip(config_files, paths) if path is not None}
 
 
 def get_required_registration(paths_to_collect, registry_key="registry", configuration_file_extensions=[".yaml", ".yml"], verbose=0):
@@ -88,11 +241,11 @@ def get_required_registration(paths_to_collect, registry_key="registry", configu
             if path.is_dir():
                 if verbose:
                     print(f"Scanning directory '{path}'")
+                extensions = tuple(configuration_file_extensions)
                 for dirpath, dirnames, filenames in os.walk(path):
                     for filename in filenames:
-                        config = pathlib.Path(dirpath)/filename
-                        if config.suffix in configuration_file_extensions:
-                            paths.append(config)
+                        if filename.endswith(extensions):
+                            paths.append(pathlib.Path(dirpath)/filename)
 
             elif path.is_file():
                 paths.append(path)
@@ -112,6 +265,13 @@ def get_required_registration(paths_to_collect, registry_key="registry", configu
 
     return required_keys
 
+def _reconstruct_namespace(cls, state):
+    """Creates a NameSpace (or derived class) from the given (pickled) entries, see :func:`NameSpace.__reduce__`"""
+    namespace = cls.__new__(cls)
+    namespace.__setstate__(state)
+    return namespace
+
+
 class NameSpace:
     """This is the main class representing our configuration.
     This configuration can be loaded from a configuration file
@@ -165,6 +325,7 @@ class NameSpace:
         registry_key: str
         When the configuration files contain this key, it is replaced with its value that is stored in the registry or provided in the environment
         """
+        self._sub_namespaces()
         self._sub_config_key = sub_config_key
         self._registry_key = registry_key
         self._modifiable = True
@@ -173,7 +334,24 @@ class NameSpace:
 
     def clone(self):
         """Returns a copy of this namespace"""
-        return NameSpace(self.dict(), self._modifiable, self._sub_config_key, self._registry_key)
+        # copy the structure directly, the entries have already been processed when loading this namespace
+        namespace = type(self).__new__(type(self))
+        namespace.__dict__.update({
+            _sub_config_key: self._sub_config_key,
+            _registry_key: self._registry_key,
+            _modifiable: self._modifiable,
+            _ns_children: {},
+        })
+        children = self.__dict__[_ns_children]
+        for key, value in vars(self).items():
+            if key in _ignore_keys:
+                continue
+            if key in children:
+                value = value.clone()
+            elif isinstance(value, list):
+                value = [v.clone() if isinstance(v, NameSpace) else v for v in value]
+            namespace._raw_set(key, value)
+        return namespace
 
     def keys(self):
         """Returns the current list of keys in this namespace"""
@@ -190,32 +368,37 @@ class NameSpace:
         """Sets a value for a given key. This key can contain periods, which are parsed to index sub-namespaces"""
         if not self._modifiable:
             raise AttributeError(f"You are trying to overwrite key {key} in a frozen namespace")
-        keys = key.split(".")
-        if len(keys) > 1:
-            getattr(self,keys[0]).set(".".join(keys[1:]), value)
-        else:
-            self[key] = value
+        namespace = self
+        first, period, rest = key.partition(".")
+        while period:
+            namespace = getattr(namespace, first)
+            first, period, rest = rest.partition(".")
+        namespace[first] = value
 
     def delete(self, key):
         """Removes the given key from this namespace. The key can contain periods, which are parsed into sub-namespaces"""
         if not self._modifiable:
             raise AttributeError(f"You are trying to delete key {key} from a frozen namespace")
+        namespace = self
+        first, period, rest = key.partition(".")
+        while period:
+            namespace = namespace[first]
+            first, period, rest = rest.partition(".")
+        # the sub-namespace might have been frozen separately
+        if not namespace._modifiable:
+            raise AttributeError(f"You are trying to delete key {key} from a frozen namespace")
+        delattr(namespace, first)
 
-        keys = key.split(".")
-        if len(keys) > 1:
-            self[keys[0]].delete(".".join(keys[1:]))
-        else:
-            delattr(self, key)
-
-    def _load_subconfig(self, name, value):
+    def _load_subconfig(self, name, value, sub_config_files):
         # create sub-config
         namespace = NameSpace(value, self._modifiable, self._sub_config_key, self._registry_key)
         # check if there is a sub-config file listed
         if self._sub_config_key in namespace.keys():
             if not isinstance(namespace[self._sub_config_key], str):
                 raise ValueError(f"The '{self._sub_config_key}' keyword requires a file name, but we got '{namespace[self._sub_config_key]}' instead")
-            # load config file
-            sub_config = NameSpace(namespace[self._sub_config_key], self._modifiable, self._sub_config_key, self._registry_key)
+            # load config file, using the path that was found when prefetching it
+            sub_config_file = sub_config_files.get(namespace[self._sub_config_key], namespace[self._sub_config_key])
+            sub_config = NameSpace(sub_config_file, self._modifiable, self._sub_config_key, self._registry_key)
             keys = list(sub_config.keys())
             if name in keys:
                 # set this as the config
@@ -237,54 +420,68 @@ class NameSpace:
         return namespace
 
 
+    def _prefetch_subconfigs(self, config):
+        # returns the paths of the prefetched sub-config files, indexed by the way they are referenced
+        # collect the sub-config files that are referenced in the given configuration
+        sub_config_files = set()
+        for value in config.values():
+            for element in value if isinstance(value, list) else [value]:
+                if isinstance(element, dict) and isinstance(element.get(self._sub_config_key), str):
+                    sub_config_files.add(element[self._sub_config_key])
+        # a single file is read directly when it is loaded
+        if len(sub_config_files) > 1:
+            return _prefetch_config_files(sub_config_files)
+        return {}
+
+    def _convert_value(self, name, value, sub_config_files):
+        # transform dictionaries, also inside lists, into sub-namespaces
+        if isinstance(value, dict):
+            return self._load_subconfig(name, value, sub_config_files)
+        if isinstance(value, list):
+            return [self._load_subconfig(name, element, sub_config_files) if isinstance(element, dict) else element for element in value]
+        return value
+
     def update(self, config):
         """Updates this namespace with the given configuration. Sub-namespaces will be entirely overwritten, not updated."""
         # Updates this namespace with the given config
         # read from yaml file, if it is a file
         loaded_config = self.load(config)
+        # read all referenced sub-config files in parallel, so that they are already found and cached when the sub-namespaces are built
+        sub_config_files = self._prefetch_subconfigs(loaded_config)
         # recurse through configuration dictionary to build nested namespaces
         config = {}
         for name, value in loaded_config.items():
             # if the name contains at least one period, we have a nested namespace
             if "." in name:
-                # split the name into the first part and the rest
-                first, rest = name.split(".", 1)
-                # create a new namespace if not existing
-                if first not in config.keys():
+                # walk down the nested namespaces, and create them if not existing
+                first, *parents, name = name.split(".")
+                if not isinstance(config.get(first), NameSpace):
                     config[first] = NameSpace({}, self._modifiable, self._sub_config_key, self._registry_key)
-                # update the sub-namespace
-                config[first].update({rest:value})
+                namespace = config[first]
+                for parent in parents:
+                    if not isinstance(namespace.__dict__.get(parent), NameSpace):
+                        namespace._raw_set(parent, NameSpace({}, self._modifiable, self._sub_config_key, self._registry_key))
+                    namespace = namespace[parent]
+                namespace._raw_set(name, self._convert_value(name, value, sub_config_files))
             else:
-
-                if isinstance(value, dict):
-                    config[name] = self._load_subconfig(name, value)
-                elif isinstance(value, list):
-                    config[name] = []
-                    for element in value:
-                        if isinstance(element, dict):
-                            config[name].append(self._load_subconfig(name, element))
-                        else:
-                            config[name].append(element)
-                else:
-                    config[name] = value
+                config[name] = self._convert_value(name, value, sub_config_files)
 
         # update configuration
-        self.__dict__.update(config)
+        for name, value in config.items():
+            self._raw_set(name, value)
 
     def freeze(self):
         """Freezes this namespace recursively."""
         # recursively freeze all sub-namespaces
-        for value in vars(self).values():
-            if isinstance (value, NameSpace):
-                value.freeze()
+        for value in self.__dict__[_ns_children].values():
+            value.freeze()
         self._modifiable = False
 
     def unfreeze(self):
         """Unfreezes this namespace recursively."""
         self._modifiable = True
-        for value in vars(self).values():
-            if isinstance (value, NameSpace):
-                value.unfreeze()
+        for value in self.__dict__[_ns_children].values():
+            value.unfreeze()
 
     def load(self, config):
         """Loads the configuration from the given YAML filename, which might include package @ filename"""
@@ -300,28 +497,45 @@ class NameSpace:
         with open(yaml_file, "w") as f:
             f.write(self.dump(indent))
 
+    def _format_lookup(self):
+        """Returns a function that returns the formatted value of a fully-quoted attribute as a string, or None if there is no such attribute"""
+        # compute the attributes only once, and format them only when they are requested
+        attributes = dict(self.iter_attributes())
+        formatted = {}
+
+        def lookup(key):
+            if key not in formatted:
+                if key not in attributes:
+                    return None
+                # mark this key as being formatted, so that circular references stay unformatted
+                formatted[key] = None
+                prefixes = [""]
+                for part in key.split(".")[:-1]:
+                    prefixes.append(prefixes[-1] + part + ".")
+                formatted[key] = str(_format_value(attributes[key], lookup, prefixes))
+            return formatted[key]
+
+        return lookup
+
     def format(self, string):
         """Formats the given string and replaces keys with contents
 
         This function replaces all occurrences of `{KEY}` values in the given string with the value stored in this `NameSpace` instance.
         Here, `KEY` can be any fully-quoted string as returned by the :func:`attributes` function.
+        Values that contain `{KEY}`s themselves are formatted before they are inserted.
 
         If the given string is a list, formatting is applied to all elements of that list (recursively).
 
         Returns:
           the formatted string
         """
-        if isinstance(string, list):
-            return [self.format(s) if isinstance(s, (str, list)) else s for s in string]
-
-        for k,v in self.attributes().items():
-            string = string.replace(f"{{{k}}}", str(v))
-        return string
+        return _format_value(string, self._format_lookup(), [""])
 
     def format_self(self):
-        """Formats all internal string variables (and list of string variables) using the :func:`format` function.
+        """Formats all internal string variables (and list of string variables) by replacing `{KEY}` values, see :func:`format`.
         This function works recursively, it formats all sub-namespaces accordingly.
-        Note that nested sub_namespaces can have both nested and non-nested keys:
+        Inside sub-namespaces, keys are looked up as fully-quoted attributes first, and then relative to each enclosing sub-namespace.
+        Hence, nested sub_namespaces can have both nested and non-nested keys:
 
         nested:
             key: value
@@ -330,19 +544,24 @@ class NameSpace:
 
         both nested.key1 and nested.key2 will be evaluated as "value".
         """
-        # format all strings and lists of strings
-        for key, value in self.attributes().items():
-            if isinstance (value, (str,list)):
-                self.set(key, self.format(value))
-        # recursively freeze all sub-namespaces
-        for value in vars(self).values():
-            if isinstance (value, NameSpace):
-                value.format_self()
+        # the attributes of this namespace are computed once, and handed down to the sub-namespaces
+        self._format_self_with(self._format_lookup(), [""])
+
+    def _format_self_with(self, lookup, prefixes):
+        """Formats all strings of this namespace and its sub-namespaces using the given lookup function of the root namespace"""
+        children = self.__dict__[_ns_children]
+        for key, value in vars(self).items():
+            if key in _ignore_keys:
+                continue
+            if key in children:
+                value._format_self_with(lookup, prefixes + [prefixes[-1] + key + "."])
+            elif isinstance(value, (str, list)):
+                self[key] = _format_value(value, lookup, prefixes)
 
 
     def dump(self, indent=4):
         """Pretty-prints the config to a string"""
-        return yaml.dump(self.dict(), indent=indent)
+        return yaml.dump(self.dict(), Dumper=_Dumper, indent=indent)
 
     def attributes(self):
         """Returns a list of attributes of this NameSpace including all sub-namespaces
@@ -352,22 +571,34 @@ class NameSpace:
         Returns:
           attributes: dict[attribute->value]
         """
-        attributes = {}
-        for key in vars(self):
-            if isinstance(self[key], NameSpace):
-                attributes.update({
-                    key+"."+k:v for k,v in (self[key].attributes()).items()
-                })
-            elif key not in _ignore_keys:
-                attributes[key] = self[key]
-        return attributes
+        return dict(self.iter_attributes())
+
+    def iter_attributes(self, prefix=""):
+        """Iterates through the attributes of this NameSpace including all sub-namespaces, see :func:`attributes`
+
+        Parameters:
+        prefix: str
+        A prefix that is prepended to all attributes
+
+        Yields:
+          (attribute, value) pairs
+        """
+        children = self.__dict__[_ns_children]
+        for key, value in vars(self).items():
+            if key in _ignore_keys:
+                continue
+            if key in children:
+                yield from value.iter_attributes(prefix + key + ".")
+            else:
+                yield prefix + key, value
 
     def dict(self):
         """Returns the entire configuration as a nested dictionary, by converting sub-namespaces"""
         d = {}
+        children = self.__dict__[_ns_children]
         for k,v in vars(self).items():
             if not k in _ignore_keys:
-                if isinstance(v, NameSpace):
+                if k in children:
                     d[k] = v.dict()
                 elif isinstance(v, list):
                     d[k] = [i.dict() if isinstance(i, NameSpace) else i for i in v]
@@ -390,66 +621,80 @@ class NameSpace:
         if not self._modifiable:
             raise AttributeError(f"You are trying to set key {key} in a frozen namespace")
         if isinstance(value, dict):
-            self.__dict__.update({key:NameSpace(value, self._modifiable, self._sub_config_key, self._registry_key)})
+            value = NameSpace(value, self._modifiable, self._sub_config_key, self._registry_key)
+        self._raw_set(key, value)
+
+    def _raw_set(self, key, value):
+        """Sets the given value without any checks; the caller needs to make sure that this namespace is modifiable"""
+        if key == _ns_children:
+            raise ValueError(f"The key {key} is reserved for internal use and cannot be set")
+        self.__dict__[key] = value
+        self._track_sub_namespace(key, value)
+
+    def _track_sub_namespace(self, key, value):
+        """Adds or removes the given entry in the list of sub-namespaces"""
+        # keep track of the sub-namespaces, so that recursive functions do not need to go through all entries
+        if isinstance(value, NameSpace):
+            self._sub_namespaces()[key] = value
         else:
-            self.__dict__.update({key:value})
+            self._sub_namespaces().pop(key, None)
+
+    def _sub_namespaces(self):
+        """Returns the mapping of all sub-namespaces, which is created if it does not exist yet"""
+        children = self.__dict__.get(_ns_children)
+        if children is None:
+            # derived classes might set entries before calling __init__
+            children = self.__dict__[_ns_children] = {}
+        return children
 
     def __getattr__(self, key):
         """Allows adding new sub-namespaces inline"""
         if key in _ignore_keys:
             return self.__getattribute__(key)
+        # special methods are looked up by python protocols (copy, pickle, ...), which should not add new keys
+        if key.startswith("__") and key.endswith("__"):
+            raise AttributeError(key)
         if not self._modifiable:
             raise AttributeError(f"You are trying to add new key {key} to a frozen namespace")
         # create new empty namespace if not existing
         namespace = NameSpace({}, self._modifiable, self._sub_config_key, self._registry_key)
-        self.update({key:namespace})
+        self._raw_set(key, namespace)
         return namespace
 
     def __setattr__(self, key, value):
         """Allows adding new sub-namespaces inline"""
-        if key != _modifiable and hasattr(self, _modifiable) and not self._modifiable:
+        # read the flag directly, a missing flag means that we are still initializing
+        entries = self.__dict__
+        if key != _modifiable and not entries.get(_modifiable, True):
             raise AttributeError(f"You are trying to add new key {key} to a frozen namespace")
-        # call  the original setattr function
-        super(NameSpace, self).__setattr__(key,value)
-
-    def __getstate__(self):
-        """No idea why this is required"""
-        return self.__dict__
-
-    def __setstate__(self, value):
-        """No idea why this is required"""
-        self.__dict__.update(value)
+        # NameSpace does not define any descriptors, so we can store the value directly
+        if type(self) is NameSpace:
+            self._raw_set(key, value)
+            return
+        # derived classes might define properties or other descriptors
+        if key == _ns_children:
+            raise ValueError(f"The key {key} is reserved for internal use and cannot be set")
+        super(NameSpace, self).__setattr__(key, value)
+        self._track_sub_namespace(key, entries.get(key))
+
+    def __delattr__(self, key):
+        """Removes the given entry, also from the list of sub-namespaces"""
+        if key == _ns_children:
+            raise ValueError(f"The key {key} is reserved for internal use and cannot be deleted")
+        super(NameSpace, self).__delattr__(key)
+        self._sub_namespaces().pop(key, None)
+
+    def __reduce__(self):
+        """Allows pickling and copying, restoring the entries without going through __setattr__"""
+        # the sub-namespaces are tracked again when reconstructing
+        state = {k:v for k,v in self.__dict__.items() if k != _ns_children}
+        return (_reconstruct_namespace, (type(self), state))
+
+    def __setstate__(self, state):
+        """Restores the given entries, which is also used for namespaces that were pickled without tracked sub-namespaces"""
+        self.__dict__.update(state)
+        self.__dict__[_ns_children] = {k:v for k,v in state.items() if isinstance(v, NameSpace)}
 
     def _load_config_file(self, config):
         """Finds the configuration file within a package and loads the configuration"""
-        assert isinstance(config, str), f"The given configuration {config} is not a file name"
-        splits = config.split("@")
-
-        if len(splits) == 1:
-            # load config file directly
-            config = splits[0].strip()
-
-        elif len(splits) == 2:
-            # load config from package resources
-            package = splits[0].strip()
-            resource = pathlib.Path(splits[1].strip())
-            # list all resource files within the package
-            package_files = list_config_files(package, [resource.suffix])
-            # find possible candidates for resource files
-            candidates = [f for f in package_files if str(f).endswith(str(resource))]
-            if not len(candidates):
-                raise ValueError(f"Could not find configuration file {resource} in package {package}; possible files are: {package_files}")
-            if len(candidates) > 1:
-                raise ValueError(f"The given config file {resource} is not unique in package {package}; candidates are: {candidates}")
-            # take the unique file
-            config = candidates[0]
-
-        else:
-            raise ValueError(f"Could not interpret configuration file {config}")
-
-        if not os.path.isfile(config):
-            raise IOError(f"Could not find config file {config}")
-
-        with open(config, 'r') as f:
-            # return the loaded yaml file, or an empty dictionary in case safe_load returns None
-            return yaml.safe_load(f) or {}
+        return _parse_yaml_file(_find_config_file(config))
@@ -1,8 +1,33 @@
 import yamlparser
+import copy
 import os
+import pickle
 import tempfile
 import unittest
 
+class SubNameSpace(yamlparser.NameSpace):
+    """A class derived from NameSpace, which needs to be defined globally to be picklable"""
+
+
+class InitNameSpace(yamlparser.NameSpace):
+    """A class derived from NameSpace, which sets entries before initializing the namespace"""
+    def __init__(self, config):
+        self.extra = 1
+        self.extra_namespace = yamlparser.NameSpace(dict(value=2))
+        super().__init__(config)
+
+
+class PropertyNameSpace(yamlparser.NameSpace):
+    """A class derived from NameSpace, which defines a property with a setter"""
+    @property
+    def scaled(self):
+        return self.value * 2
+
+    @scaled.setter
+    def scaled(self, scaled):
+        self.value = scaled // 2
+
+
 class TestYaml(unittest.TestCase):
 
     def test_load_yaml_from_path(self):
@@ -25,6 +50,26 @@ class TestYaml(unittest.TestCase):
         with self.assertRaises(IOError):
             yamlparser.NameSpace("path/to/nowhere.yaml")
 
+        # test non-existing and ambiguous files in packages
+        with self.assertRaises(ValueError):
+            yamlparser.NameSpace("yamlparser @ nowhere.yaml")
+        with self.assertRaises(ValueError):
+            yamlparser.NameSpace("yamlparser @ config.yaml")
+
+    def test_list_config_files(self):
+        """test listing the configuration files of a package"""
+        config_files = yamlparser.list_config_files("yamlparser")
+        self.assertEqual(
+            sorted(f.name for f in config_files),
+            ["registry_config.yaml", "sub_config.yaml", "test_config.yaml"]
+        )
+        for f in config_files:
+            self.assertTrue(f.is_file())
+
+        # test filtering with other extensions
+        self.assertEqual(yamlparser.list_config_files("yamlparser", [".yml"]), [])
+
+
     def test_load_yaml_attributes(self):
         """test that all attributes and their values are loaded correctly from the yaml file"""
 
@@ -71,6 +116,16 @@ class TestYaml(unittest.TestCase):
         self.assertEqual(namespace["nested"]["email"], "name@host.domain")
 
 
+    def test_dotted_keys(self):
+        """test that several dotted keys can share the same sub-namespaces"""
+        namespace = yamlparser.NameSpace({"nested.sub.first": 1, "nested.sub.second": 2, "nested.other": 3})
+
+        self.assertEqual(namespace.nested.sub.first, 1)
+        self.assertEqual(namespace.nested.sub.second, 2)
+        self.assertEqual(namespace.nested.other, 3)
+        self.assertEqual(namespace.attributes(), {"nested.sub.first": 1, "nested.sub.second": 2, "nested.other": 3})
+
+
     def test_extend(self):
         yaml_file = os.path.join(os.path.dirname(__file__), "test_config.yaml")
         namespace = yamlparser.NameSpace(yaml_file)
@@ -123,6 +178,29 @@ class TestYaml(unittest.TestCase):
         self.assertEqual(namespace.nested.email, "name@host.domain")
 
 
+    def test_reload_modified_file(self):
+        """test that loading the same file twice returns independent objects, and that modified files are parsed again"""
+        try:
+            file_descriptor,filename = tempfile.mkstemp(".yaml")
+            yamlparser.NameSpace(dict(name="Name", values=[1,2])).save(filename)
+
+            # modifying one namespace does not change the other
+            first = yamlparser.NameSpace(filename)
+            first.values.append(3)
+            second = yamlparser.NameSpace(filename)
+            self.assertEqual(second.values, [1,2])
+
+            # changed files are read again
+            yamlparser.NameSpace(dict(name="Other Name", values=[1,2])).save(filename)
+            os.utime(filename, ns=(0,0))
+            third = yamlparser.NameSpace(filename)
+            self.assertEqual(third.name, "Other Name")
+
+        finally:
+            os.close(file_descriptor)
+            os.remove(filename)
+
+
     def test_format(self):
         namespace = yamlparser.NameSpace(dict(name="Name", nested=dict(email="name@host.domain"), value=1.))
 
@@ -132,6 +210,11 @@ class TestYaml(unittest.TestCase):
         formatted = namespace.format(["{name}", "{nested.email}", "{value}"])
         self.assertEqual(formatted, ["Name", "name@host.domain", "1.0"])
 
+        # values that contain keys are formatted as well
+        chained = yamlparser.NameSpace(dict(a="{b}/x", b="/root"))
+        self.assertEqual(chained.format("{a}"), "/root/x")
+        self.assertEqual(chained.format(["{a}", ["{b}"]]), ["/root/x", ["/root"]])
+
         # add some internal names that shall be formatted
         namespace["my_name"] = "{name}"
         namespace.nested.my_email = "{nested.email}"
@@ -150,6 +233,12 @@ class TestYaml(unittest.TestCase):
         self.assertEqual(namespace.nested.my_email, "name@host.domain")
         self.assertEqual(namespace.nested["new_email"], ["name@host.domain"])
 
+        # test that formatted values can be used to format other values, independent of their order
+        namespace = yamlparser.NameSpace(dict(log="{nested.dir}/log", nested=dict(dir="{base}/nested", base="/tmp"), base="/root"))
+        namespace.format_self()
+        self.assertEqual(namespace.nested.dir, "/root/nested")
+        self.assertEqual(namespace.log, "/root/nested/log")
+
 
     def test_freeze(self):
         namespace = yamlparser.NameSpace(dict(name="Name", nested=dict(email="name@host.domain"), value=1.))
@@ -168,9 +257,43 @@ class TestYaml(unittest.TestCase):
             namespace.name = "New Name"
             namespace["name"] = "New Name"
 
+        # modifying the returned attributes does not modify the namespace
+        attributes = namespace.attributes()
+        self.assertEqual(attributes, {"name": "Name", "nested.email": "name@host.domain", "value": 1.})
+        attributes["name"] = "Other Name"
+        self.assertEqual(namespace.attributes()["name"], "Name")
+
+        self.assertEqual(namespace.format("{name}"), "Name")
+
         # try to unfreeze
         namespace.unfreeze()
         namespace.new_name = "New Name"
+        self.assertEqual(namespace.attributes()["new_name"], "New Name")
+        self.assertEqual(namespace.format("{new_name}"), "New Name")
+
+        # replaced sub-namespaces are frozen, too
+        namespace["nested"] = dict(other="other@host.domain")
+        namespace.freeze()
+        with self.assertRaises(AttributeError):
+            namespace.nested.other = "New Name"
+
+
+    def test_frozen_with_modifiable_children(self):
+        """test that frozen namespaces reflect changes of sub-namespaces that are still modifiable"""
+        namespace = yamlparser.NameSpace(dict(nested=dict(email="name@host.domain")), modifiable=False)
+        self.assertEqual(namespace.attributes(), {"nested.email": "name@host.domain"})
+        self.assertEqual(namespace.format("{nested.email}"), "name@host.domain")
+        namespace.nested.email = "other@host.domain"
+        self.assertEqual(namespace.attributes(), {"nested.email": "other@host.domain"})
+        self.assertEqual(namespace.format("{nested.email}"), "other@host.domain")
+
+        # the same for sub-namespaces that get unfrozen explicitly
+        namespace = yamlparser.NameSpace(dict(nested=dict(email="name@host.domain")))
+        namespace.freeze()
+        self.assertEqual(namespace.attributes(), {"nested.email": "name@host.domain"})
+        namespace.nested.unfreeze()
+        namespace.nested.email = "other@host.domain"
+        self.assertEqual(namespace.attributes(), {"nested.email": "other@host.domain"})
 
 
     def test_sub_namespace_override(self):
@@ -213,6 +336,172 @@ class TestYaml(unittest.TestCase):
         # self.assertEqual(namespace.nested.e, 3)
 
 
+    def test_clone(self):
+        yaml_file = os.path.join(os.path.dirname(__file__), "test_config.yaml")
+        namespace = yamlparser.NameSpace(yaml_file)
+        cloned = namespace.clone()
+
+        self.assertEqual(cloned.dump(), namespace.dump())
+        self.assertIsInstance(cloned.nested.sub_nested, yamlparser.NameSpace)
+
+        # modifying the clone does not modify the original
+        cloned.nested.sub_nested.name = "other"
+        cloned.list_value.append(1)
+        cloned.new_value = 1
+        self.assertEqual(namespace.nested.sub_nested.name, "subnested")
+        self.assertEqual(namespace.list_value, [10, 42, 101])
+        self.assertNotIn("new_value", namespace.keys())
+
+        # frozen namespaces create frozen clones
+        namespace.freeze()
+        cloned = namespace.clone()
+        with self.assertRaises(AttributeError):
+            cloned.nested.name = "other"
+
+
+    def test_derived_sub_namespaces(self):
+        """test that sub-namespaces of derived classes are handled like any other sub-namespace"""
+        namespace = yamlparser.NameSpace(dict(name="Name"))
+        namespace["sub"] = SubNameSpace(dict(value=2))
+
+        self.assertEqual(namespace.attributes(), {"name": "Name", "sub.value": 2})
+        self.assertEqual(namespace.dict(), dict(name="Name", sub=dict(value=2)))
+        self.assertNotIn("!!python", namespace.dump())
+
+        cloned = namespace.clone()
+        self.assertIs(type(cloned.sub), SubNameSpace)
+        self.assertIsNot(cloned.sub, namespace.sub)
+
+        namespace.freeze()
+        with self.assertRaises(AttributeError):
+            namespace.sub.value = 3
+
+
+    def test_derived_properties(self):
+        """test that assignments to derived classes go through properties"""
+        namespace = PropertyNameSpace(dict(value=1))
+        self.assertEqual(namespace.scaled, 2)
+        namespace.scaled = 8
+        self.assertEqual(namespace.value, 4)
+        self.assertEqual(namespace.attributes(), {"value": 4})
+
+        # sub-namespaces are still tracked
+        namespace.sub = yamlparser.NameSpace(dict(name="Name"))
+        self.assertEqual(namespace.attributes(), {"value": 4, "sub.name": "Name"})
+        namespace.sub = 3
+        self.assertEqual(namespace.dict(), dict(value=4, sub=3))
+
+        namespace.freeze()
+        with self.assertRaises(AttributeError):
+            namespace.scaled = 10
+
+
+    def test_derived_init(self):
+        """test that derived classes can set entries before calling NameSpace.__init__"""
+        namespace = InitNameSpace(dict(name="Name"))
+        self.assertEqual(namespace.attributes(), {"extra": 1, "extra_namespace.value": 2, "name": "Name"})
+
+        namespace.freeze()
+        with self.assertRaises(AttributeError):
+            namespace.extra_namespace.value = 3
+
+
+    def test_reserved_keys(self):
+        """test that the internal list of sub-namespaces cannot be overwritten"""
+        with self.assertRaises(ValueError):
+            yamlparser.NameSpace({"_ns_children": 1})
+        with self.assertRaises(ValueError):
+            yamlparser.NameSpace({"nested._ns_children": 1})
+
+        namespace = yamlparser.NameSpace(dict(nested=dict(name="Name")))
+        with self.assertRaises(ValueError):
+            namespace._ns_children = 1
+        with self.assertRaises(ValueError):
+            namespace["_ns_children"] = 1
+        with self.assertRaises(ValueError):
+            del namespace._ns_children
+        self.assertEqual(namespace.attributes(), {"nested.name": "Name"})
+
+
+    def test_special_attributes(self):
+        """test that looking up special methods does not create new sub-namespaces"""
+        namespace = yamlparser.NameSpace(dict(name="Name", nested=dict(email="name@host.domain")))
+
+        self.assertFalse(hasattr(namespace, "__deepcopy__"))
+        self.assertEqual(list(namespace.keys()), ["name", "nested"])
+
+        # copying works since the special methods are not replaced by sub-namespaces
+        copied = copy.deepcopy(namespace)
+        self.assertEqual(copied.dict(), namespace.dict())
+        self.assertIsNot(copied.nested, namespace.nested)
+
+
+    def test_pickle(self):
+        """test that pickling keeps the contents, the frozen state and the type of namespaces"""
+        namespace = yamlparser.NameSpace(dict(name="Name", nested=dict(email="name@host.domain")))
+        namespace.freeze()
+        unpickled = pickle.loads(pickle.dumps(namespace))
+        self.assertEqual(unpickled.dict(), namespace.dict())
+        self.assertIsInstance(unpickled.nested, yamlparser.NameSpace)
+        with self.assertRaises(AttributeError):
+            unpickled.nested.name = "Name"
+
+        # unfreezing reaches the sub-namespaces again
+        unpickled.unfreeze()
+        unpickled.nested.name = "Name"
+        self.assertEqual(unpickled.attributes(), {"name": "Name", "nested.email": "name@host.domain", "nested.name": "Name"})
+
+        # derived classes are restored
+        unpickled = pickle.loads(pickle.dumps(SubNameSpace(dict(name="Name"))))
+        self.assertIs(type(unpickled), SubNameSpace)
+        self.assertEqual(unpickled.name, "Name")
+
+
+    def test_multiple_sub_configs(self):
+        """test loading several different sub-configuration files"""
+        try:
+            file_descriptor,filename = tempfile.mkstemp(".yaml")
+            yamlparser.NameSpace(dict(other=dict(email="name@host.domain"))).save(filename)
+
+            namespace = yamlparser.NameSpace(dict(
+                nested={"yaml": "yamlparser @ test_config.yaml"},
+                other={"yaml": filename, "name": "Name"},
+            ))
+        finally:
+            os.close(file_descriptor)
+            os.remove(filename)
+
+        self.assertEqual(namespace.nested.sub_nested.name, "subnested")
+        self.assertEqual(namespace.other.email, "name@host.domain")
+        self.assertEqual(namespace.other.name, "Name")
+
+        # errors in any of the files are still raised
+        with self.assertRaises(IOError):
+            yamlparser.NameSpace(dict(
+                nested={"yaml": os.path.join(os.path.dirname(__file__), "test_config.yaml")},
+                other={"yaml": "path/to/nowhere.yaml"},
+            ))
+
+
+    def test_unpickle_previous_version(self):
+        """test that namespaces pickled by previous versions, which do not track their sub-namespaces, can be used"""
+        pickled = (
+            b'\x80\x02cyamlparser.namespace\nNameSpace\nq\x00)\x81q\x01}q\x02(X\x0f\x00\x00\x00_sub_config_keyq\x03X\x04\x00\x00\x00yamlq\x04'
+            b'X\r\x00\x00\x00_registry_keyq\x05X\x08\x00\x00\x00registryq\x06X\x0b\x00\x00\x00_modifiableq\x07\x88X\x04\x00\x00\x00nameq\x08'
+            b'X\x04\x00\x00\x00Nameq\tX\x06\x00\x00\x00nestedq\nh\x00)\x81q\x0b}q\x0c(h\x03h\x04h\x05h\x06h\x07\x88X\x05\x00\x00\x00emailq\r'
+            b'X\x10\x00\x00\x00name@host.domainq\x0eubub.'
+        )
+        namespace = pickle.loads(pickled)
+        self.assertEqual(namespace.dict(), dict(name="Name", nested=dict(email="name@host.domain")))
+
+        namespace.new_name = "New Name"
+        namespace.freeze()
+        with self.assertRaises(AttributeError):
+            namespace.nested.email = "other@host.domain"
+        namespace.unfreeze()
+        namespace.delete("new_name")
+
+
     def test_delete(self):
 
         namespace = yamlparser.NameSpace(dict(name="Name", nested=dict(email="name@host.domain")))